@@ -82,6 +82,9 @@ class VerificationRequest(BaseModel):
     capability: str
     agent_name: str
 
+class BatchVerificationRequest(BaseModel):
+    requests: List[VerificationRequest] = Field(..., max_length=100)
+
 class VerificationResponse(BaseModel):
     tool_name: str
     capability: str
@@ -242,13 +245,8 @@ async def register_tool(
         "verified": db_tool.verified
     }
 
-# Verify capability
-@app.post("/mcp/tools/verify", response_model=VerificationResponse)
-async def verify_capability(
-    request: VerificationRequest,
-    db: Session = Depends(get_db)
-):
-    """Verify if a tool has a specific capability"""
+def _check_capability(request: VerificationRequest, db: Session) -> VerificationResponse:
+    """Check one capability and stage its audit log entry; the caller commits"""
     start_time = datetime.utcnow()
     
     # Find tool
@@ -270,7 +268,6 @@ async def verify_capability(
             duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
         )
         db.add(log_entry)
-        db.commit()
         
         return VerificationResponse(
             tool_name=request.tool_name,
@@ -297,7 +294,6 @@ async def verify_capability(
             duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
         )
         db.add(log_entry)
-        db.commit()
         
         return VerificationResponse(
             tool_name=request.tool_name,
@@ -336,7 +332,6 @@ async def verify_capability(
         duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
     )
     db.add(log_entry)
-    db.commit()
     
     return VerificationResponse(
         tool_name=request.tool_name,
@@ -346,6 +341,28 @@ async def verify_capability(
         message="Capability verified" if has_capability else "Capability not found"
     )
 
+# Verify capability
+@app.post("/mcp/tools/verify", response_model=VerificationResponse)
+async def verify_capability(
+    request: VerificationRequest,
+    db: Session = Depends(get_db)
+):
+    """Verify if a tool has a specific capability"""
+    result = _check_capability(request, db)
+    db.commit()
+    return result
+
+# Verify several capabilities in one round trip
+@app.post("/mcp/tools/verify/batch", response_model=List[VerificationResponse])
+async def verify_capabilities_batch(
+    batch: BatchVerificationRequest,
+    db: Session = Depends(get_db)
+):
+    """Verify a list of capabilities, returning results in request order"""
+    results = [_check_capability(request, db) for request in batch.requests]
+    db.commit()
+    return results
+
 # List tools
 @app.get("/mcp/tools/list")
 async def list_tools(
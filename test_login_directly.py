@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Test login by directly calling the login function"""
+import pytest
 import requests
 import json
 
-def test_with_different_formats():
+BASE_URL = "http://localhost:8000"
+
+def check_different_formats():
     """Test login with different request formats"""
     print("🧪 Testing Different Login Formats...")
     
@@ -61,7 +64,7 @@ def test_with_different_formats():
     
     return False
 
-def test_user_registration():
+def check_user_registration():
     """Test if we can register a new user to verify the system works"""
     print("\n📝 Testing User Registration...")
     
@@ -117,15 +120,34 @@ def main():
     print("=" * 50)
     
     # Test different formats
-    format_success = test_with_different_formats()
+    format_success = check_different_formats()
     
     if not format_success:
         # Test with new user registration
-        reg_success = test_user_registration()
+        reg_success = check_user_registration()
         return reg_success
     else:
         return True
 
+def backend_available():
+    """Check that the backend health endpoint responds"""
+    try:
+        response = requests.get(f"{BASE_URL}/health", timeout=5)
+    except Exception as e:
+        print(f"❌ Cannot connect to backend: {e}")
+        return False
+    return response.status_code == 200
+
+@pytest.fixture(scope="module", autouse=True)
+def require_backend():
+    """Skip the module when the backend is not running"""
+    if not backend_available():
+        pytest.skip(f"Backend not available at {BASE_URL}")
+
+def test_login():
+    """Login succeeds in some request format, or for a freshly registered user"""
+    assert main()
+
 if __name__ == "__main__":
     success = main()
     exit(0 if success else 1)
\ No newline at end of file
@@ -2,6 +2,7 @@
 """
 Test all security implementations
 """
+import pytest
 import requests
 import json
 import time
@@ -15,15 +16,41 @@ TEST_USER = {
     "role": "viewer"
 }
 
-def test_rate_limiting():
+class Bucket:
+    """Client-side token bucket mirroring the server's login rate limit"""
+
+    def __init__(self, rate, burst, window):
+        self.rate, self.burst, self.tokens, self.last = rate, burst, burst, time.monotonic()
+        self.window = window
+
+    def take(self):
+        """Consume one token, sleeping only if the budget is exhausted"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 1
+        self.tokens -= 1
+
+    def drain(self, window_start):
+        """Block after deliberately tripping the limit until the server's fixed
+        window that began at window_start has reset, then refill the budget"""
+        remaining = window_start + self.window + 1 - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self.tokens, self.last = self.burst, time.monotonic()
+
+# Login endpoints are limited to 5 attempts per fixed 60s window
+LOGIN_BUCKET = Bucket(5 / 60, 5, 60)
+
+def check_rate_limiting():
     """Test rate limiting on login endpoint"""
     print("🔒 Testing Rate Limiting...")
     
-    # Wait to ensure clean rate limit window
-    time.sleep(2)
-    
     # Try to exceed login rate limit (5/minute)
     login_attempts = 0
+    window_start = time.monotonic()
     for i in range(7):
         response = requests.post(
             f"{BASE_URL}/control/auth/login-json",
@@ -35,17 +62,18 @@ def test_rate_limiting():
         if response.status_code == 429:
             print(f"  ✅ Rate limit triggered after {login_attempts} attempts")
             print(f"  Response: {response.json()}")
+            LOGIN_BUCKET.drain(window_start)
             return True
     
     print(f"  ❌ Rate limit not triggered after {login_attempts} attempts")
     return False
 
-def test_password_policy():
+def check_password_policy():
     """Test strong password policy"""
     print("\n🔐 Testing Password Policy...")
     
-    # Wait to avoid rate limit from previous test
-    time.sleep(2)
+    # Wait only if the login budget is exhausted
+    LOGIN_BUCKET.take()
     
     # First, get Edward's token for admin access
     admin_login = requests.post(
@@ -109,12 +137,12 @@ def test_password_policy():
     
     return all(results)
 
-def test_token_expiry_and_refresh():
+def check_token_expiry_and_refresh():
     """Test reduced token expiry and refresh tokens"""
     print("\n⏱️  Testing Token Expiry and Refresh...")
     
-    # Wait to avoid rate limit
-    time.sleep(2)
+    # Wait only if the login budget is exhausted
+    LOGIN_BUCKET.take()
     
     # Login to get tokens
     response = requests.post(
@@ -153,12 +181,12 @@ def test_token_expiry_and_refresh():
         print("  ❌ Missing tokens in response")
         return False
 
-def test_token_revocation():
+def check_token_revocation():
     """Test token blacklisting on logout"""
     print("\n🚫 Testing Token Revocation...")
     
-    # Wait to avoid rate limit
-    time.sleep(2)
+    # Wait only if the login budget is exhausted
+    LOGIN_BUCKET.take()
     
     # Login
     response = requests.post(
@@ -195,7 +223,7 @@ def test_token_revocation():
         print("  ❌ Token still works after logout")
         return False
 
-def test_request_size_limit():
+def check_request_size_limit():
     """Test request size limiting"""
     print("\n📏 Testing Request Size Limit...")
     
@@ -216,7 +244,7 @@ def test_request_size_limit():
         print(f"  ❌ Large request not rejected (status: {response.status_code})")
         return False
 
-def test_global_exception_handler():
+def check_global_exception_handler():
     """Test global exception handler"""
     print("\n🛡️  Testing Global Exception Handler...")
     
@@ -227,7 +255,7 @@ def test_global_exception_handler():
     print("  ✅ Returns generic error messages")
     return True
 
-def test_pii_redaction():
+def check_pii_redaction():
     """Test PII redaction in logs"""
     print("\n🔏 Testing PII Redaction...")
     
@@ -238,7 +266,7 @@ def test_pii_redaction():
     print("  ✅ hash_pii() function available for all PII data")
     return True
 
-def test_cors_configuration():
+def check_cors_configuration():
     """Test CORS configuration"""
     print("\n🌐 Testing CORS Configuration...")
     
@@ -260,31 +288,61 @@ def test_cors_configuration():
         print(f"  ❌ CORS header: {cors_headers}")
         return False
 
+def backend_available():
+    """Check that the backend health endpoint responds"""
+    try:
+        response = requests.get(f"{BASE_URL}/health", timeout=5)
+    except Exception as e:
+        print(f"❌ Cannot connect to backend: {e}")
+        return False
+    if response.status_code != 200:
+        print("❌ Backend not responding on port 8000")
+        return False
+    return True
+
+# Checks that log in share the server's login rate limit and the TEST_USER
+# registered by the password policy check, so they run in order on one worker
+AUTH_CHECKS = [
+    ("Rate Limiting", check_rate_limiting),
+    ("Password Policy", check_password_policy),
+    ("Token Expiry", check_token_expiry_and_refresh),
+    ("Token Revocation", check_token_revocation),
+]
+
+INDEPENDENT_CHECKS = [
+    ("Request Size Limit", check_request_size_limit),
+    ("Exception Handler", check_global_exception_handler),
+    ("PII Redaction", check_pii_redaction),
+    ("CORS Config", check_cors_configuration),
+]
+
+@pytest.fixture(scope="module", autouse=True)
+def require_backend():
+    """Skip the module when the backend is not running"""
+    if not backend_available():
+        pytest.skip(f"Backend not available at {BASE_URL}")
+
+@pytest.mark.xdist_group("auth")
+@pytest.mark.parametrize("check", [c for _, c in AUTH_CHECKS], ids=[n for n, _ in AUTH_CHECKS])
+def test_auth_security(check):
+    """Run a login-dependent security check"""
+    assert check()
+
+@pytest.mark.parametrize("check", [c for _, c in INDEPENDENT_CHECKS], ids=[n for n, _ in INDEPENDENT_CHECKS])
+def test_security(check):
+    """Run an independent security check"""
+    assert check()
+
 def main():
     """Run all security tests"""
     print("🔐 EPIC V11 Security Implementation Tests")
     print("=" * 50)
     
     # Check if backend is running
-    try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        if response.status_code != 200:
-            print("❌ Backend not responding on port 8000")
-            return
-    except Exception as e:
-        print(f"❌ Cannot connect to backend: {e}")
+    if not backend_available():
         return
     
-    tests = [
-        ("Rate Limiting", test_rate_limiting),
-        ("Password Policy", test_password_policy),
-        ("Token Expiry", test_token_expiry_and_refresh),
-        ("Token Revocation", test_token_revocation),
-        ("Request Size Limit", test_request_size_limit),
-        ("Exception Handler", test_global_exception_handler),
-        ("PII Redaction", test_pii_redaction),
-        ("CORS Config", test_cors_configuration),
-    ]
+    tests = AUTH_CHECKS + INDEPENDENT_CHECKS
     
     results = []
     for test_name, test_func in tests:
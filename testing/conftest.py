@@ -1,55 +1,186 @@
 """Test configuration and fixtures"""
 import pytest
+import pytest_asyncio
 import asyncio
+import base64
 import httpx
+import json
+import orjson
 import os
+import time
+import uvloop
 from typing import AsyncGenerator
 
-# Test configuration
-CONTROL_PANEL_URL = "https://epic.pos.com"
-AGNO_URL = "https://epic.pos.com/agno"
-MCP_URL = "https://epic.pos.com/mcp"
+from epic_api import (
+    BOARD_MEMBERS_PATH, CONTROL_PANEL_URL, EDWARD_EMAIL, EDWARD_PASSWORD, LOGIN_PATH,
+    MCP_HEALTH_PATH, MCP_TOOLS_LIST_PATH, ME_PATH, ok_json
+)
+from epic_common import INSECURE_SSL_CONTEXT
 
-# Edward's test credentials
-EDWARD_EMAIL = "eip@iug.net"
-EDWARD_PASSWORD = "1234Abcd!"
+# Edward's bearer token is kept in the pytest cache between runs and reused
+# until it is within this many seconds of expiring
+ADMIN_TOKEN_CACHE_KEY = "epic/admin_token"
+TOKEN_EXPIRY_MARGIN = 60
+
+# Upper bound on in-flight requests across the session clients; size it to
+# the servers' worker count so gathered tests do not push them past the knee
+TEST_CONCURRENCY = int(os.environ.get("EPIC_TEST_CONCURRENCY", "32"))
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create a uvloop event loop for the test session."""
+    loop = uvloop.new_event_loop()
     yield loop
     loop.close()
 
-@pytest.fixture
-async def auth_token() -> str:
-    """Get authentication token for Edward"""
-    async with httpx.AsyncClient(verify=False) as client:
-        response = await client.post(
-            f"{CONTROL_PANEL_URL}/control/auth/login",
-            data={
-                "username": EDWARD_EMAIL,
-                "password": EDWARD_PASSWORD
-            }
+async def _orjson_response(response: httpx.Response):
+    """Response hook: decode JSON bodies with orjson instead of the stdlib parser"""
+    response.json = lambda **kwargs: orjson.loads(response.content)
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that releases a semaphore permit once closed"""
+    
+    def __init__(self, stream: httpx.AsyncByteStream, sem: asyncio.Semaphore):
+        self._stream = stream
+        self._sem = sem
+        self._released = False
+    
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+    
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._sem.release()
+
+class _BoundedTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport that holds a shared semaphore for each request
+    
+    The permit is kept until the response body has been read and its stream
+    closed, so the cap covers whole requests, not just the headers.
+    """
+    
+    def __init__(self, sem: asyncio.Semaphore, **kwargs):
+        super().__init__(**kwargs)
+        self._sem = sem
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._sem.acquire()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self._sem.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, self._sem)
+        return response
+
+# Client fixtures are session-scoped so connections and the login stay warm
+# for the whole run. Under pytest-xdist every worker is its own process, so
+# each worker logs in and owns its clients; nothing is shared across workers.
+# Tests pass paths relative to base_url; HTTP/2 lets gathered requests
+# multiplex over one connection per origin.
+def _session_client(sem: asyncio.Semaphore) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=CONTROL_PANEL_URL,
+        transport=_BoundedTransport(
+            sem,
+            http2=True,
+            verify=INSECURE_SSL_CONTEXT,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0)
+        ),
+        event_hooks={"response": [_orjson_response]},
+        timeout=10.0
+    )
+
+def _jwt_exp(token: str) -> float:
+    """Read a JWT's exp claim without verifying the signature; 0 if absent"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims.get("exp", 0))
+    except (IndexError, ValueError):
+        return 0
+
+async def _admin_token(client: httpx.AsyncClient, cache: pytest.Cache) -> str:
+    """Reuse the cached token if /control/auth/me still accepts it, else log in"""
+    cached = cache.get(ADMIN_TOKEN_CACHE_KEY, None)
+    if cached and cached["exp"] > time.time() + TOKEN_EXPIRY_MARGIN:
+        response = await client.get(
+            ME_PATH,
+            headers={"Authorization": f"Bearer {cached['token']}"}
         )
-        assert response.status_code == 200
-        data = response.json()
-        return data["access_token"]
+        if response.status_code == 200:
+            return cached["token"]
+    
+    response = await client.post(
+        LOGIN_PATH,
+        data={
+            "username": EDWARD_EMAIL,
+            "password": EDWARD_PASSWORD
+        }
+    )
+    assert response.status_code == 200
+    token = response.json()["access_token"]
+    cache.set(ADMIN_TOKEN_CACHE_KEY, {"token": token, "exp": _jwt_exp(token)})
+    return token
 
-@pytest.fixture
-async def admin_client(auth_token: str) -> AsyncGenerator[httpx.AsyncClient, None]:
-    """HTTP client with admin authentication"""
+@pytest_asyncio.fixture(scope="session")
+async def request_sem() -> asyncio.Semaphore:
+    """Semaphore shared by every session client, created on the session loop"""
+    return asyncio.Semaphore(TEST_CONCURRENCY)
+
+@pytest_asyncio.fixture(scope="session")
+async def admin_client(request, request_sem: asyncio.Semaphore) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """HTTP client authenticated as Edward, reusing a cached token across runs"""
+    async with _session_client(request_sem) as client:
+        token = await _admin_token(client, request.config.cache)
+        client.headers["Authorization"] = f"Bearer {token}"
+        yield client
+
+@pytest_asyncio.fixture(scope="session")
+async def anonymous_client(request_sem: asyncio.Semaphore) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Pooled HTTP client without authentication, shared by steady-state tests"""
+    async with _session_client(request_sem) as client:
+        yield client
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warmup(anonymous_client: httpx.AsyncClient):
+    """Pay DNS, TLS and lazy service startup once, before any test runs"""
+    # Failures are left for the tests themselves to report
+    await asyncio.gather(
+        anonymous_client.get("/health"),
+        anonymous_client.get(MCP_HEALTH_PATH),
+        return_exceptions=True
+    )
+
+# Login and unauthorized-access tests must not inherit cookies or a warm
+# connection from earlier tests, so they trade pooling for isolation and
+# pay a fresh handshake each time.
+@pytest_asyncio.fixture
+async def fresh_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Unpooled HTTP client with an empty cookie jar, closed after each test"""
     async with httpx.AsyncClient(
-        headers={"Authorization": f"Bearer {auth_token}"},
-        verify=False
+        base_url=CONTROL_PANEL_URL,
+        verify=INSECURE_SSL_CONTEXT,
+        limits=httpx.Limits(max_keepalive_connections=0),
+        event_hooks={"response": [_orjson_response]},
+        timeout=10.0
     ) as client:
         yield client
 
-@pytest.fixture
-async def anonymous_client() -> AsyncGenerator[httpx.AsyncClient, None]:
-    """HTTP client without authentication"""
-    async with httpx.AsyncClient(verify=False) as client:
-        yield client
+@pytest_asyncio.fixture(scope="session")
+async def board_members(anonymous_client: httpx.AsyncClient) -> dict:
+    """Board members payload, fetched once per session"""
+    return ok_json(await anonymous_client.get(BOARD_MEMBERS_PATH))
+
+@pytest_asyncio.fixture(scope="session")
+async def mcp_catalog(anonymous_client: httpx.AsyncClient) -> list:
+    """MCP tool catalog, fetched once per session"""
+    return ok_json(await anonymous_client.get(MCP_TOOLS_LIST_PATH))
 
 @pytest.fixture
 def test_query():
@@ -1,38 +1,243 @@
 """End-to-end testing with Puppeteer for EPIC V11 system"""
 import pytest
+import pytest_asyncio
 import asyncio
+import base64
 import json
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+import os
+import pathlib
+import queue
+import re
+import threading
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright, expect, Page, Browser, BrowserContext, CDPSession, Route
+
+BROWSER_ARGS = ['--disable-web-security', '--ignore-certificate-errors']
+LOGIN_URL = "https://epic.pos.com/login"
+DASHBOARD_URL = "https://epic.pos.com/"
+CONTEXT_OPTIONS = {
+    "ignore_https_errors": True,
+    "viewport": {'width': 1920, 'height': 1080}
+}
+PAGE_POOL_SIZE = 4
+
+# Requests the UI tests never look at. Set E2E_BLOCK_ASSETS=0 to keep images
+# and fonts for screenshot review; stylesheets always load because the status
+# indicators are empty styled divs that are only visible with CSS
+BLOCK_ASSETS = os.environ.get("E2E_BLOCK_ASSETS", "1") != "0"
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "segment.io",
+    "hotjar.com"
+)
+
+async def _filter_requests(route: Route):
+    """Abort analytics and (optionally) static asset requests"""
+    request = route.request
+    host = urlparse(request.url).hostname or ""
+    if host.endswith(BLOCKED_HOSTS) or (BLOCK_ASSETS and request.resource_type in BLOCKED_RESOURCE_TYPES):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class AsyncArtifactWriter:
+    """Write artifact bytes to disk on a daemon thread so tests never block on IO"""
+    
+    def __init__(self):
+        self._queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, path: str, data: bytes):
+        """Queue bytes to be written to path"""
+        self._queue.put((path, data))
+    
+    def join(self):
+        """Block until every submitted artifact has been written"""
+        self._queue.join()
+    
+    def _run(self):
+        while True:
+            path, data = self._queue.get()
+            try:
+                pathlib.Path(path).write_bytes(data)
+            except OSError as e:
+                print(f"⚠️ Failed to write artifact {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+# Screenshots are non-critical artifacts, so they are written off the event loop
+_artifact_writer = AsyncArtifactWriter()
+
+# One CDP session per page, dropped automatically when the page goes away
+_cdp_sessions: "weakref.WeakKeyDictionary[Page, CDPSession]" = weakref.WeakKeyDictionary()
+
+async def _fast_screenshot(page: Page, path: str, error: bool = False):
+    """Capture a JPEG screenshot via CDP, skipping error captures on CI"""
+    if error and os.environ.get("CI"):
+        return
+    cdp = _cdp_sessions.get(page)
+    if cdp is None:
+        cdp = await page.context.new_cdp_session(page)
+        _cdp_sessions[page] = cdp
+    result = await cdp.send("Page.captureScreenshot", {
+        "format": "jpeg",
+        "quality": 80,
+        "optimizeForSpeed": True
+    })
+    _artifact_writer.submit(path, base64.b64decode(result["data"]))
+
+# The login inputs are React-controlled, so values go through the native
+# setter and an input event to update component state before submitting
+FILL_AND_SUBMIT_LOGIN = """(creds) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [selector, value] of [['input[type=email]', creds.email], ['input[type=password]', creds.password]]) {
+        const input = document.querySelector(selector);
+        setValue.call(input, value);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+    }
+    document.querySelector('button[type=submit]').click();
+}"""
+
+async def _login_as_edward(page: Page):
+    """Log in as Edward through the login form"""
+    # Navigate to login if not already there
+    if "login" not in page.url:
+        await page.goto(LOGIN_URL, wait_until="domcontentloaded")
+    await page.wait_for_selector('input[type="email"]', state="visible")
+    
+    # Fill credentials and submit in a single round-trip
+    await page.evaluate(FILL_AND_SUBMIT_LOGIN, {"email": "eip@iug.net", "password": "1234Abcd!"})
+    
+    # Wait for dashboard
+    await page.wait_for_url("**/", timeout=10000)
+
+async def _authenticated_storage_state(browser: Browser) -> Dict[str, Any]:
+    """Log in once in a throwaway context and capture its cookies/storage"""
+    context = await browser.new_context(**CONTEXT_OPTIONS)
+    await context.route("**/*", _filter_requests)
+    try:
+        page = await context.new_page()
+        await _login_as_edward(page)
+        return await context.storage_state()
+    finally:
+        await context.close()
+
+class PagePool:
+    """Pool of pre-created pages, each in its own isolated browser context"""
+    
+    def __init__(self, browser: Browser, storage_state: Optional[Dict[str, Any]] = None,
+                 size: int = PAGE_POOL_SIZE):
+        self.browser = browser
+        self.storage_state = storage_state
+        self.size = size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._contexts: List[BrowserContext] = []
+    
+    async def _new_page(self) -> Page:
+        """Create one page in a fresh, request-filtered context"""
+        context = await self.browser.new_context(
+            storage_state=self.storage_state, **CONTEXT_OPTIONS
+        )
+        await context.route("**/*", _filter_requests)
+        self._contexts.append(context)
+        return await context.new_page()
+    
+    async def start(self) -> "PagePool":
+        """Create all contexts and pages up front"""
+        for _ in range(self.size):
+            self._queue.put_nowait(await self._new_page())
+        return self
+    
+    async def acquire(self) -> Page:
+        """Wait for a free page; concurrent callers never share one"""
+        return await self._queue.get()
+    
+    async def release(self, page: Page):
+        """Reset a page and its context and return it to the pool
+        
+        A page that cannot be reset (crashed or closed) is swapped for a new
+        one; either way a page always goes back, so acquire() never starves.
+        """
+        try:
+            await page.goto("about:blank")
+            await page.set_viewport_size(CONTEXT_OPTIONS["viewport"])
+            await page.context.clear_cookies()
+            if self.storage_state:
+                await page.context.add_cookies(self.storage_state["cookies"])
+        except Exception as e:
+            print(f"⚠️ Replacing pooled page that failed to reset: {e}")
+            try:
+                broken = page.context
+                page = await self._new_page()
+                self._contexts.remove(broken)
+                await broken.close()
+            except Exception as e:
+                print(f"⚠️ Could not replace pooled page: {e}")
+        finally:
+            self._queue.put_nowait(page)
+    
+    async def close(self):
+        """Close every context owned by the pool"""
+        for context in self._contexts:
+            await context.close()
+
+# Session scope is per process, so under pytest-xdist (-n auto) each worker
+# launches its own browser and page pool
+@pytest_asyncio.fixture(scope="session")
+async def browser():
+    """Launch one Chromium instance shared by the whole test session"""
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(
+        headless=False,  # Set to True for CI/CD
+        args=BROWSER_ARGS
+    )
+    yield browser
+    await browser.close()
+    await playwright.stop()
+
+@pytest.fixture(scope="session", autouse=True)
+def artifact_writer():
+    """Flush queued screenshots when the session ends"""
+    yield _artifact_writer
+    _artifact_writer.join()
+
+@pytest_asyncio.fixture(scope="session")
+async def authenticated_storage_state(browser: Browser) -> Dict[str, Any]:
+    """Edward's login state, captured once per worker"""
+    return await _authenticated_storage_state(browser)
+
+@pytest_asyncio.fixture(scope="session")
+async def page_pool(browser: Browser, authenticated_storage_state: Dict[str, Any]):
+    """Pre-warmed pages for this worker, already logged in as Edward"""
+    pool = await PagePool(browser, authenticated_storage_state).start()
+    yield pool
+    await pool.close()
 
 class TestE2EWithPuppeteer:
     """End-to-end tests using Playwright (Puppeteer equivalent)"""
-    
-    @pytest.fixture
-    async def browser_context(self):
-        """Setup browser context"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=False,  # Set to True for CI/CD
-                args=['--disable-web-security', '--ignore-certificate-errors']
-            )
-            context = await browser.new_context(
-                ignore_https_errors=True,
-                viewport={'width': 1920, 'height': 1080}
-            )
-            yield context
-            await browser.close()
 
     @pytest.mark.asyncio
-    async def test_edward_login_flow(self, browser_context: BrowserContext):
+    async def test_edward_login_flow(self, page_pool: PagePool):
         """Test Edward's complete login flow"""
-        page = await browser_context.new_page()
+        page = await page_pool.acquire()
         
         try:
+            # Pooled pages start logged in, so drop the session first
+            await page.context.clear_cookies()
+            
             # Navigate to login page
-            await page.goto("https://epic.pos.com/login", wait_until="networkidle")
+            await page.goto(LOGIN_URL, wait_until="domcontentloaded")
+            await page.wait_for_selector('input[type="email"]', state="visible")
             
             # Take screenshot of login page
-            await page.screenshot(path="/home/epic/epic11/login_page.png")
+            await _fast_screenshot(page, "/home/epic/epic11/login_page.jpg")
             
             # Fill in Edward's credentials
             await page.fill('input[type="email"]', "eip@iug.net")
@@ -49,7 +254,7 @@ class TestE2EWithPuppeteer:
             assert "EPIC V11 Control Panel" in dashboard_title
             
             # Take screenshot of dashboard
-            await page.screenshot(path="/home/epic/epic11/dashboard.png")
+            await _fast_screenshot(page, "/home/epic/epic11/dashboard.jpg")
             
             # Verify Edward's admin role is displayed
             user_role = await page.locator("text=Role:").locator("..").text_content()
@@ -58,19 +263,19 @@ class TestE2EWithPuppeteer:
             print("✅ Edward login flow successful")
             
         except Exception as e:
-            await page.screenshot(path="/home/epic/epic11/error_login.png")
+            await _fast_screenshot(page, "/home/epic/epic11/error_login.jpg", error=True)
             raise e
         finally:
-            await page.close()
+            await page_pool.release(page)
 
     @pytest.mark.asyncio
-    async def test_board_members_display(self, browser_context: BrowserContext):
+    async def test_board_members_display(self, page_pool: PagePool):
         """Test that all 11 board members are displayed"""
-        page = await browser_context.new_page()
+        page = await page_pool.acquire()
         
         try:
-            # Login first
-            await self._login_as_edward(page)
+            # Open the dashboard as Edward
+            await self._open_dashboard(page)
             
             # Check board members section
             board_section = page.locator("text=AI Board of Directors").locator("..")
@@ -87,24 +292,24 @@ class TestE2EWithPuppeteer:
             assert "AI Board of Directors" in board_text
             
             # Take screenshot of board section
-            await page.screenshot(path="/home/epic/epic11/board_members.png")
+            await _fast_screenshot(page, "/home/epic/epic11/board_members.jpg")
             
             print("✅ Board members section displayed correctly")
             
         except Exception as e:
-            await page.screenshot(path="/home/epic/epic11/error_board.png")
+            await _fast_screenshot(page, "/home/epic/epic11/error_board.jpg", error=True)
             raise e
         finally:
-            await page.close()
+            await page_pool.release(page)
 
     @pytest.mark.asyncio
-    async def test_emergency_override_button(self, browser_context: BrowserContext):
+    async def test_emergency_override_button(self, page_pool: PagePool):
         """Test emergency override button is visible for admin"""
-        page = await browser_context.new_page()
+        page = await page_pool.acquire()
         
         try:
-            # Login as Edward (admin)
-            await self._login_as_edward(page)
+            # Open the dashboard as Edward
+            await self._open_dashboard(page)
             
             # Look for emergency override button
             emergency_btn = page.locator("text=EMERGENCY HALT")
@@ -115,27 +320,35 @@ class TestE2EWithPuppeteer:
             assert await emergency_btn.is_enabled()
             
             # Take screenshot showing emergency button
-            await page.screenshot(path="/home/epic/epic11/emergency_button.png")
+            await _fast_screenshot(page, "/home/epic/epic11/emergency_button.jpg")
             
             print("✅ Emergency override button visible for admin")
             
         except Exception as e:
-            await page.screenshot(path="/home/epic/epic11/error_emergency.png")
+            await _fast_screenshot(page, "/home/epic/epic11/error_emergency.jpg", error=True)
             raise e
         finally:
-            await page.close()
+            await page_pool.release(page)
 
+    # Halting changes global system state that the other E2E tests assert on,
+    # so this test never runs alongside them on another xdist worker
+    @pytest.mark.disruptive
+    @pytest.mark.skipif(
+        "PYTEST_XDIST_WORKER" in os.environ,
+        reason="halts the system; run serially with: pytest -m disruptive testing/e2e/"
+    )
     @pytest.mark.asyncio
-    async def test_emergency_halt_flow(self, browser_context: BrowserContext):
+    async def test_emergency_halt_flow(self, page_pool: PagePool):
         """Test complete emergency halt and resume flow"""
-        page = await browser_context.new_page()
+        page = await page_pool.acquire()
         
         try:
-            # Login as Edward
-            await self._login_as_edward(page)
+            # Open the dashboard as Edward
+            await self._open_dashboard(page)
             
-            # Check initial system status
-            status_indicator = page.locator(".bg-green-500, .bg-red-500, .bg-yellow-500").first
+            # Check initial system status; board-member dots share the bg-*
+            # colours, so target the larger system-status dot itself
+            status_indicator = page.locator(".w-4.h-4.rounded-full").first
             initial_status = await status_indicator.get_attribute("class")
             
             # Click emergency halt button
@@ -153,14 +366,12 @@ class TestE2EWithPuppeteer:
                 await halt_btn.click()
                 
                 # Wait for system to halt
-                await page.wait_for_timeout(3000)
-                
-                # Verify system status changed to halted
-                status_after_halt = await page.locator(".bg-red-500").first.is_visible()
-                assert status_after_halt, "System should show halted status"
+                await expect(status_indicator, "System should show halted status").to_have_class(
+                    re.compile(r"\bbg-red-500\b")
+                )
                 
                 # Take screenshot of halted system
-                await page.screenshot(path="/home/epic/epic11/system_halted.png")
+                await _fast_screenshot(page, "/home/epic/epic11/system_halted.jpg")
                 
                 # Now test resume
                 resume_btn = page.locator("text=RESUME SYSTEM")
@@ -175,34 +386,32 @@ class TestE2EWithPuppeteer:
                 await page.locator("text=Resume").click()
                 
                 # Wait for system to resume
-                await page.wait_for_timeout(3000)
-                
-                # Verify system resumed
-                status_after_resume = await page.locator(".bg-green-500").first.is_visible()
-                assert status_after_resume, "System should show normal status after resume"
+                await expect(status_indicator, "System should show normal status after resume").to_have_class(
+                    re.compile(r"\bbg-green-500\b")
+                )
                 
                 # Take screenshot of resumed system
-                await page.screenshot(path="/home/epic/epic11/system_resumed.png")
+                await _fast_screenshot(page, "/home/epic/epic11/system_resumed.jpg")
                 
                 print("✅ Emergency halt and resume flow completed successfully")
             else:
                 print("⚠️ Emergency halt button not found - system may already be halted")
                 
         except Exception as e:
-            await page.screenshot(path="/home/epic/epic11/error_halt_flow.png")
+            await _fast_screenshot(page, "/home/epic/epic11/error_halt_flow.jpg", error=True)
             print(f"❌ Emergency halt flow failed: {e}")
             # Don't raise exception to avoid leaving system in halted state
         finally:
-            await page.close()
+            await page_pool.release(page)
 
     @pytest.mark.asyncio
-    async def test_system_status_monitoring(self, browser_context: BrowserContext):
+    async def test_system_status_monitoring(self, page_pool: PagePool):
         """Test real-time system status monitoring"""
-        page = await browser_context.new_page()
+        page = await page_pool.acquire()
         
         try:
-            # Login as Edward
-            await self._login_as_edward(page)
+            # Open the dashboard as Edward
+            await self._open_dashboard(page)
             
             # Check system status section
             status_section = page.locator("text=System Status").locator("..")
@@ -217,95 +426,74 @@ class TestE2EWithPuppeteer:
             assert any(status in status_text.lower() for status in ["normal", "halted", "degraded"])
             
             # Take screenshot of status section
-            await page.screenshot(path="/home/epic/epic11/system_status.png")
+            await _fast_screenshot(page, "/home/epic/epic11/system_status.jpg")
             
             print("✅ System status monitoring working correctly")
             
         except Exception as e:
-            await page.screenshot(path="/home/epic/epic11/error_status.png")
+            await _fast_screenshot(page, "/home/epic/epic11/error_status.jpg", error=True)
             raise e
         finally:
-            await page.close()
+            await page_pool.release(page)
 
     @pytest.mark.asyncio
-    async def test_user_interface_responsiveness(self, browser_context: BrowserContext):
+    async def test_user_interface_responsiveness(self, page_pool: PagePool):
         """Test UI responsiveness and performance"""
-        page = await browser_context.new_page()
+        page = await page_pool.acquire()
         
         try:
-            # Enable performance monitoring
-            await page.route("**/*", lambda route: route.continue_())
+            # Measure dashboard load time from navigation start
+            await self._open_dashboard(page)
+            load_time = await page.evaluate("performance.now()")
             
-            # Start performance measurement
-            await page.goto("https://epic.pos.com/login")
-            
-            # Measure login performance
-            start_time = await page.evaluate("performance.now()")
-            
-            await self._login_as_edward(page)
-            
-            end_time = await page.evaluate("performance.now()")
-            login_time = end_time - start_time
-            
-            # Login should complete within 10 seconds
-            assert login_time < 10000, f"Login took too long: {login_time}ms"
+            # Dashboard should load within 10 seconds
+            assert load_time < 10000, f"Dashboard took too long to load: {load_time}ms"
             
             # Test responsive design by changing viewport
             await page.set_viewport_size({"width": 768, "height": 1024})  # Tablet
-            await page.screenshot(path="/home/epic/epic11/tablet_view.png")
+            await _fast_screenshot(page, "/home/epic/epic11/tablet_view.jpg")
             
             await page.set_viewport_size({"width": 375, "height": 667})   # Mobile
-            await page.screenshot(path="/home/epic/epic11/mobile_view.png")
+            await _fast_screenshot(page, "/home/epic/epic11/mobile_view.jpg")
             
-            print(f"✅ UI responsiveness test passed (Login time: {login_time:.2f}ms)")
+            print(f"✅ UI responsiveness test passed (Load time: {load_time:.2f}ms)")
             
         except Exception as e:
-            await page.screenshot(path="/home/epic/epic11/error_performance.png")
+            await _fast_screenshot(page, "/home/epic/epic11/error_performance.jpg", error=True)
             raise e
         finally:
-            await page.close()
+            await page_pool.release(page)
 
-    async def _login_as_edward(self, page: Page):
-        """Helper function to login as Edward"""
-        # Navigate to login if not already there
-        if "login" not in await page.url():
-            await page.goto("https://epic.pos.com/login", wait_until="networkidle")
-        
-        # Fill credentials
-        await page.fill('input[type="email"]', "eip@iug.net")
-        await page.fill('input[type="password"]', "1234Abcd!")
-        
-        # Submit login
-        await page.click('button[type="submit"]')
-        
-        # Wait for dashboard
-        await page.wait_for_url("**/", timeout=10000)
+    async def _open_dashboard(self, page: Page):
+        """Open the dashboard using the session's stored login"""
+        await page.goto(DASHBOARD_URL, wait_until="domcontentloaded")
+        await page.locator("h1").first.wait_for()
 
     @pytest.mark.asyncio
-    async def test_api_integration(self, browser_context: BrowserContext):
+    async def test_api_integration(self, page_pool: PagePool):
         """Test frontend integration with backend APIs"""
-        page = await browser_context.new_page()
+        page = await page_pool.acquire()
+        
+        # Monitor network requests
+        api_calls = []
+        
+        def handle_response(response):
+            if "/control/" in response.url or "/agno/" in response.url:
+                api_calls.append({
+                    "url": response.url,
+                    "status": response.status,
+                    "method": response.request.method
+                })
         
         try:
-            # Login as Edward
-            await self._login_as_edward(page)
-            
-            # Monitor network requests
-            api_calls = []
-            
-            def handle_response(response):
-                if "/control/" in response.url or "/agno/" in response.url:
-                    api_calls.append({
-                        "url": response.url,
-                        "status": response.status,
-                        "method": response.request.method
-                    })
+            # Open the dashboard as Edward
+            await self._open_dashboard(page)
             
             page.on("response", handle_response)
             
             # Trigger some API calls by interacting with UI
-            await page.reload()
-            await page.wait_for_timeout(2000)
+            async with page.expect_response(lambda r: "/control/" in r.url):
+                await page.reload()
             
             # Verify API calls were made
             assert len(api_calls) > 0, "No API calls detected"
@@ -317,13 +505,23 @@ class TestE2EWithPuppeteer:
             print(f"✅ API integration test passed ({len(successful_calls)} successful calls)")
             
         except Exception as e:
-            await page.screenshot(path="/home/epic/epic11/error_api.png")
+            await _fast_screenshot(page, "/home/epic/epic11/error_api.jpg", error=True)
             raise e
         finally:
-            await page.close()
+            page.remove_listener("response", handle_response)
+            await page_pool.release(page)
+
+E2E_REPORT_PATH = "/home/epic/epic11/e2e_test_report.json"
+
+@dataclass(slots=True)
+class E2EResult:
+    """Outcome of one end-to-end test in run_e2e_tests"""
+    test: str
+    passed: bool
+    error: str = ""
 
 # Run the tests
-async def run_e2e_tests():
+async def run_e2e_tests() -> List[E2EResult]:
     """Run all end-to-end tests"""
     print("🎭 Starting End-to-End Tests with Playwright...")
     
@@ -333,11 +531,7 @@ async def run_e2e_tests():
     async with async_playwright() as p:
         browser = await p.chromium.launch(
             headless=True,  # Set to False for debugging
-            args=['--disable-web-security', '--ignore-certificate-errors']
-        )
-        context = await browser.new_context(
-            ignore_https_errors=True,
-            viewport={'width': 1920, 'height': 1080}
+            args=BROWSER_ARGS
         )
         
         tests = [
@@ -350,28 +544,35 @@ async def run_e2e_tests():
             # Note: test_emergency_halt_flow disabled in automated run to avoid system disruption
         ]
         
-        results = []
-        for test in tests:
+        storage_state = await _authenticated_storage_state(browser)
+        pool = await PagePool(browser, storage_state).start()
+        results: List[E2EResult] = [None] * len(tests)
+        
+        async def run(index, test):
             try:
-                await test(context)
-                results.append({"test": test.__name__, "status": "PASS"})
+                await test(pool)
+                results[index] = E2EResult(test.__name__, True)
             except Exception as e:
-                results.append({"test": test.__name__, "status": "FAIL", "error": str(e)})
+                results[index] = E2EResult(test.__name__, False, str(e))
         
-        await browser.close()
-        
-        # Generate report
-        passed = sum(1 for r in results if r["status"] == "PASS")
-        total = len(results)
+        await asyncio.gather(*(run(i, test) for i, test in enumerate(tests)))
         
-        print(f"\n🎭 E2E TESTS COMPLETE: {passed}/{total} passed")
-        for result in results:
-            status_emoji = "✅" if result["status"] == "PASS" else "❌"
-            print(f"{status_emoji} {result['test']}: {result['status']}")
-            if result.get("error"):
-                print(f"    Error: {result['error']}")
-        
-        return results
+        await pool.close()
+        await browser.close()
+        _artifact_writer.join()
+    
+    # Generate report
+    passed = sum(r.passed for r in results)
+    print(f"\n🎭 E2E TESTS COMPLETE: {passed}/{len(results)} passed")
+    for result in results:
+        print(f"{'✅' if result.passed else '❌'} {result.test}: {'PASS' if result.passed else 'FAIL'}")
+        if result.error:
+            print(f"    Error: {result.error}")
+    
+    with open(E2E_REPORT_PATH, "w") as f:
+        json.dump({"passed": passed, "total": len(results), "results": [asdict(r) for r in results]}, f, indent=2)
+    
+    return results
 
 if __name__ == "__main__":
-    asyncio.run(run_e2e_tests())
\ No newline at end of file
+    asyncio.run(run_e2e_tests())
@@ -0,0 +1,67 @@
+"""EPIC endpoints, credentials and response helpers shared by the test suites
+
+The test directories are not packages, so tests import this module by its
+absolute name instead of reaching into conftest.
+"""
+from typing import Optional
+
+import httpx
+import msgspec
+import orjson
+
+# Test configuration
+CONTROL_PANEL_URL = "https://epic.pos.com"
+AGNO_URL = "https://epic.pos.com/agno"
+MCP_URL = "https://epic.pos.com/mcp"
+
+# Endpoint paths, relative to CONTROL_PANEL_URL (the session clients' base_url)
+LOGIN_PATH = "/control/auth/login"
+ME_PATH = "/control/auth/me"
+USERS_PATH = "/control/users/"
+BOARD_MEMBERS_PATH = "/agno/agno/board/members"
+AGNO_QUERY_PATH = "/agno/agno/query"
+OVERRIDE_STATUS_PATH = "/control/system/override/status"
+OVERRIDE_HALT_PATH = "/control/system/override/halt"
+OVERRIDE_RESUME_PATH = "/control/system/override/resume"
+MCP_HEALTH_PATH = "/mcp/health"
+MCP_TOOLS_LIST_PATH = "/mcp/mcp/tools/list"
+MCP_TOOL_DETAIL_PATH = "/mcp/mcp/tools/donna_protection"
+MCP_VERIFY_PATH = "/mcp/mcp/tools/verify"
+MCP_VERIFY_BATCH_PATH = "/mcp/mcp/tools/verify/batch"
+
+# Edward's test credentials
+EDWARD_EMAIL = "eip@iug.net"
+EDWARD_PASSWORD = "1234Abcd!"
+
+# Typed response bodies; fields the tests do not read are ignored on decode
+class LoginResponse(msgspec.Struct):
+    access_token: str
+    token_type: str
+
+class MeResponse(msgspec.Struct):
+    email: str
+    role: str
+
+class VerifyResponse(msgspec.Struct):
+    tool_name: str
+    capability: str
+    verified: bool
+    message: Optional[str] = None
+
+class ToolInfo(msgspec.Struct):
+    name: str
+    verified: bool
+
+class ToolDetail(msgspec.Struct):
+    tool: ToolInfo
+
+def ok_json(response: httpx.Response, expect: int = 200, model=None):
+    """Assert the status code and return the decoded JSON body
+    
+    With a model (a msgspec Struct or a container of them) the body is
+    decoded and validated into it in one pass.
+    """
+    assert response.status_code == expect, response.text
+    if model is None:
+        return orjson.loads(response.content)
+    return msgspec.json.decode(response.content, type=model)
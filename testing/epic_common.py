@@ -0,0 +1,106 @@
+"""Helpers shared by the test runner, the security audit and the pytest suites"""
+import asyncio
+import hashlib
+import ssl
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Tuple, TypeVar
+
+import httpx
+import orjson
+
+T = TypeVar("T")
+
+# Built once and shared by every client: the EPIC host uses a self-signed
+# certificate, so verification is disabled
+INSECURE_SSL_CONTEXT = ssl.create_default_context()
+INSECURE_SSL_CONTEXT.check_hostname = False
+INSECURE_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Upper bound on in-flight probes so gathered fan-out does not overload the
+# target; tune to the server's capacity
+PROBE_CONCURRENCY = 16
+
+async def bounded(sem: asyncio.Semaphore, coro: Awaitable[T]) -> T:
+    """Await coro while holding sem"""
+    async with sem:
+        return await coro
+
+def summarize(results: Dict[str, Any]) -> Dict[str, int]:
+    """Count PASS/FAIL/WARN/ERROR statuses across a results mapping"""
+    counts = Counter(
+        r.get("status", "UNKNOWN") if isinstance(r, dict) else "UNKNOWN"
+        for r in results.values()
+    )
+    return {
+        "total": len(results),
+        "passed": counts["PASS"],
+        "failed": counts["FAIL"],
+        "warnings": counts["WARN"],
+        "errors": counts["ERROR"]
+    }
+
+# Successful GETs of stable resources (doctrine, board members) are reused
+# across audits run in the same process for this many seconds
+CACHE_TTL = 300.0
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+
+# Bodies and their ETag/Last-Modified validators persist here between runs,
+# so an expired entry is revalidated with a conditional GET
+HTTP_CACHE_DIR = Path("/tmp/epic_http_cache")
+
+def _http_cache_path(url: str) -> Path:
+    return HTTP_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+def _load_validated(path: Path) -> Dict[str, Any]:
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def _store_validated(path: Path, entry: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(entry))
+
+async def cached_get(client: httpx.AsyncClient, url: str, ttl: float = CACHE_TTL) -> Tuple[int, Any]:
+    """GET url and return (status_code, json), caching 200 responses for ttl seconds
+    
+    Past the ttl the request carries If-None-Match/If-Modified-Since from the
+    last validated response, and a 304 reuses the stored body.
+    """
+    now = time.monotonic()
+    cached = _response_cache.get(url)
+    if cached and now - cached[0] < ttl:
+        return 200, cached[1]
+    
+    path = _http_cache_path(url)
+    stored = await asyncio.to_thread(_load_validated, path)
+    headers = {}
+    if stored.get("etag"):
+        headers["If-None-Match"] = stored["etag"]
+    if stored.get("last_modified"):
+        headers["If-Modified-Since"] = stored["last_modified"]
+    
+    response = await client.get(url, headers=headers)
+    if response.status_code == 304 and "body" in stored:
+        data = stored["body"]
+    elif response.status_code != 200:
+        return response.status_code, None
+    else:
+        data = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            await asyncio.to_thread(_store_validated, path, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": data
+            })
+    
+    _response_cache[url] = (now, data)
+    return 200, data
+
+def clear_response_cache():
+    """Drop every cached response"""
+    _response_cache.clear()
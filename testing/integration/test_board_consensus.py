@@ -1,6 +1,6 @@
 """Integration tests for board consensus mechanism"""
 import pytest
-from ..conftest import AGNO_URL
+from epic_api import AGNO_QUERY_PATH, BOARD_MEMBERS_PATH
 
 class TestBoardConsensus:
     """Test AI board consensus functionality"""
@@ -8,7 +8,7 @@ class TestBoardConsensus:
     @pytest.mark.asyncio
     async def test_board_members_list(self, anonymous_client):
         """Test listing all board members"""
-        response = await anonymous_client.get(f"{AGNO_URL}/agno/board/members")
+        response = await anonymous_client.get(BOARD_MEMBERS_PATH)
         assert response.status_code == 200
         data = response.json()
         
@@ -30,7 +30,7 @@ class TestBoardConsensus:
     async def test_board_query_low_risk(self, anonymous_client, test_query):
         """Test board consensus on low-risk query"""
         response = await anonymous_client.post(
-            f"{AGNO_URL}/agno/query",
+            AGNO_QUERY_PATH,
             json={
                 "query": test_query,
                 "require_consensus": True
@@ -49,7 +49,7 @@ class TestBoardConsensus:
     async def test_board_query_high_risk(self, anonymous_client, high_risk_query):
         """Test board consensus on high-risk query (should be rejected)"""
         response = await anonymous_client.post(
-            f"{AGNO_URL}/agno/query",
+            AGNO_QUERY_PATH,
             json={
                 "query": high_risk_query,
                 "require_consensus": True
@@ -67,7 +67,7 @@ class TestBoardConsensus:
     async def test_individual_board_member(self, anonymous_client, test_query):
         """Test querying individual board member"""
         response = await anonymous_client.post(
-            f"{AGNO_URL}/agno/member/CSO_Sentinel/query",
+            "/agno/agno/member/CSO_Sentinel/query",
             json={
                 "query": test_query
             }
@@ -81,13 +81,9 @@ class TestBoardConsensus:
         assert data["risk_assessment"]["has_veto"] is True
 
     @pytest.mark.asyncio
-    async def test_veto_power_members(self, anonymous_client):
+    async def test_veto_power_members(self, board_members):
         """Test that CSO and CRO have veto power"""
-        # Test CSO
-        response = await anonymous_client.get(f"{AGNO_URL}/agno/board/members")
-        data = response.json()
-        
-        veto_members = [m for m in data["members"] if m["has_veto"]]
+        veto_members = [m for m in board_members["members"] if m["has_veto"]]
         veto_names = [m["name"] for m in veto_members]
         
         assert "CSO_Sentinel" in veto_names
@@ -100,7 +96,7 @@ class TestEPICDoctrine:
     @pytest.mark.asyncio
     async def test_get_epic_doctrine(self, anonymous_client):
         """Test retrieving EPIC doctrine"""
-        response = await anonymous_client.get(f"{AGNO_URL}/agno/doctrine")
+        response = await anonymous_client.get("/agno/agno/doctrine")
         assert response.status_code == 200
         data = response.json()
         
@@ -1,7 +1,22 @@
 """Integration tests for Edward Override system"""
 import pytest
 import asyncio
-from ..conftest import CONTROL_PANEL_URL, AGNO_URL
+from epic_api import AGNO_QUERY_PATH, OVERRIDE_HALT_PATH, OVERRIDE_RESUME_PATH, OVERRIDE_STATUS_PATH
+
+async def _wait_for_status(client, expected: str, timeout: float = 5.0) -> dict:
+    """Poll override status with exponential backoff until it matches expected"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while True:
+        response = await client.get(OVERRIDE_STATUS_PATH)
+        data = response.json()
+        if data.get("status") == expected:
+            return data
+        if loop.time() + delay > deadline:
+            raise AssertionError(f"System status {data.get('status')!r} did not become {expected!r} within {timeout}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
 
 class TestEdwardOverride:
     """Test Edward's emergency override functionality"""
@@ -9,7 +24,7 @@ class TestEdwardOverride:
     @pytest.mark.asyncio
     async def test_system_override_status(self, admin_client):
         """Test getting system override status"""
-        response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/system/override/status")
+        response = await admin_client.get(OVERRIDE_STATUS_PATH)
         assert response.status_code == 200
         data = response.json()
         
@@ -20,21 +35,21 @@ class TestEdwardOverride:
     async def test_emergency_halt_and_resume_cycle(self, admin_client, emergency_halt_reason):
         """Test complete halt and resume cycle"""
         # First, ensure system is normal
-        status_response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/system/override/status")
+        status_response = await admin_client.get(OVERRIDE_STATUS_PATH)
         initial_status = status_response.json()
         
         # If system is halted, resume it first
         if initial_status["status"] == "HALTED":
             resume_response = await admin_client.post(
-                f"{CONTROL_PANEL_URL}/control/system/override/resume",
+                OVERRIDE_RESUME_PATH,
                 json={"reason": "Clearing previous halt for testing"}
             )
             assert resume_response.status_code == 200
-            await asyncio.sleep(2)  # Wait for system to process
+            await _wait_for_status(admin_client, "NORMAL")
 
         # Test HALT command
         halt_response = await admin_client.post(
-            f"{CONTROL_PANEL_URL}/control/system/override/halt",
+            OVERRIDE_HALT_PATH,
             json={"reason": emergency_halt_reason}
         )
         assert halt_response.status_code == 200
@@ -43,22 +58,20 @@ class TestEdwardOverride:
         assert halt_data["override_type"] == "HALT"
         assert halt_data["reason"] == emergency_halt_reason
 
-        # Verify system is halted
-        await asyncio.sleep(2)  # Wait for system to process
-        status_response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/system/override/status")
-        status_data = status_response.json()
-        assert status_data["status"] == "HALTED"
-
-        # Test that AGNO service respects halt
-        agno_response = await admin_client.post(
-            f"{AGNO_URL}/agno/query",
-            json={"query": "What is the current time?"}
+        # Verify system is halted and that AGNO service respects halt
+        status_data, agno_response = await asyncio.gather(
+            _wait_for_status(admin_client, "HALTED"),
+            admin_client.post(
+                AGNO_QUERY_PATH,
+                json={"query": "What is the current time?"}
+            )
         )
+        assert status_data["status"] == "HALTED"
         assert agno_response.status_code == 503  # Service unavailable
 
         # Test RESUME command
         resume_response = await admin_client.post(
-            f"{CONTROL_PANEL_URL}/control/system/override/resume",
+            OVERRIDE_RESUME_PATH,
             json={"reason": "Test complete, resuming operations"}
         )
         assert resume_response.status_code == 200
@@ -67,16 +80,14 @@ class TestEdwardOverride:
         assert resume_data["resolved_at"] is not None
 
         # Verify system is resumed
-        await asyncio.sleep(2)  # Wait for system to process
-        status_response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/system/override/status")
-        status_data = status_response.json()
+        status_data = await _wait_for_status(admin_client, "NORMAL")
         assert status_data["status"] == "NORMAL"
 
     @pytest.mark.asyncio
     async def test_halt_requires_admin(self, anonymous_client, emergency_halt_reason):
         """Test that halt command requires admin privileges"""
         response = await anonymous_client.post(
-            f"{CONTROL_PANEL_URL}/control/system/override/halt",
+            OVERRIDE_HALT_PATH,
             json={"reason": emergency_halt_reason}
         )
         assert response.status_code == 401  # Unauthorized
@@ -84,7 +95,7 @@ class TestEdwardOverride:
     @pytest.mark.asyncio
     async def test_override_history(self, admin_client):
         """Test viewing override history"""
-        response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/system/override/history")
+        response = await admin_client.get("/control/system/override/history")
         assert response.status_code == 200
         history = response.json()
         
@@ -102,21 +113,21 @@ class TestEdwardOverride:
         """Test that halting an already halted system returns error"""
         # First halt
         halt_response = await admin_client.post(
-            f"{CONTROL_PANEL_URL}/control/system/override/halt",
+            OVERRIDE_HALT_PATH,
             json={"reason": emergency_halt_reason}
         )
         
         if halt_response.status_code == 200:
             # Try to halt again
-            await asyncio.sleep(1)
+            await _wait_for_status(admin_client, "HALTED")
             second_halt = await admin_client.post(
-                f"{CONTROL_PANEL_URL}/control/system/override/halt",
+                OVERRIDE_HALT_PATH,
                 json={"reason": "Second halt attempt"}
             )
             assert second_halt.status_code == 400  # Bad request
             
             # Clean up - resume system
             await admin_client.post(
-                f"{CONTROL_PANEL_URL}/control/system/override/resume",
+                OVERRIDE_RESUME_PATH,
                 json={"reason": "Cleaning up after test"}
             )
\ No newline at end of file
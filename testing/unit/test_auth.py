@@ -1,31 +1,42 @@
 """Unit tests for authentication system"""
 import pytest
 import httpx
-from ..conftest import CONTROL_PANEL_URL, EDWARD_EMAIL, EDWARD_PASSWORD
+import asyncio
+from epic_api import (
+    EDWARD_EMAIL, EDWARD_PASSWORD, LOGIN_PATH, ME_PATH, OVERRIDE_STATUS_PATH, USERS_PATH,
+    LoginResponse, MeResponse, ok_json
+)
+
+# User management, system override status and audit logs
+ADMIN_ENDPOINTS = [
+    USERS_PATH,
+    OVERRIDE_STATUS_PATH,
+    "/control/system/audit-logs"
+]
 
 class TestAuthentication:
     """Test authentication endpoints"""
     
+    @pytest.mark.smoke
     @pytest.mark.asyncio
-    async def test_login_success(self, anonymous_client):
+    async def test_login_success(self, fresh_client):
         """Test successful login with Edward's credentials"""
-        response = await anonymous_client.post(
-            f"{CONTROL_PANEL_URL}/control/auth/login",
+        token = ok_json(await fresh_client.post(
+            LOGIN_PATH,
             data={
                 "username": EDWARD_EMAIL,
                 "password": EDWARD_PASSWORD
             }
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "access_token" in data
-        assert data["token_type"] == "bearer"
+        ), model=LoginResponse)
+        assert token.access_token
+        assert token.token_type == "bearer"
 
+    @pytest.mark.regression
     @pytest.mark.asyncio
-    async def test_login_invalid_credentials(self, anonymous_client):
+    async def test_login_invalid_credentials(self, fresh_client):
         """Test login with invalid credentials"""
-        response = await anonymous_client.post(
-            f"{CONTROL_PANEL_URL}/control/auth/login",
+        response = await fresh_client.post(
+            LOGIN_PATH,
             data={
                 "username": "wrong@email.com",
                 "password": "wrongpassword"
@@ -33,38 +44,37 @@ class TestAuthentication:
         )
         assert response.status_code == 401
 
+    @pytest.mark.regression
     @pytest.mark.asyncio
     async def test_get_current_user(self, admin_client):
         """Test getting current user info"""
-        response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/auth/me")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["email"] == EDWARD_EMAIL
-        assert data["role"] == "admin"
+        user = ok_json(await admin_client.get(ME_PATH), model=MeResponse)
+        assert user.email == EDWARD_EMAIL
+        assert user.role == "admin"
 
+    @pytest.mark.regression
     @pytest.mark.asyncio
-    async def test_unauthorized_access(self, anonymous_client):
+    async def test_unauthorized_access(self, fresh_client):
         """Test accessing protected endpoint without auth"""
-        response = await anonymous_client.get(f"{CONTROL_PANEL_URL}/control/users/")
+        response = await fresh_client.get(USERS_PATH)
         assert response.status_code == 401
 
 class TestRoleBasedAccess:
     """Test role-based access control"""
     
+    @pytest.mark.regression
+    @pytest.mark.parametrize("path", ADMIN_ENDPOINTS)
     @pytest.mark.asyncio
-    async def test_admin_access_users(self, admin_client):
-        """Test admin can access user management"""
-        response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/users/")
+    async def test_admin_endpoint_ok(self, admin_client, path):
+        """Test admin can access each protected endpoint"""
+        response = await admin_client.get(path)
         assert response.status_code == 200
 
+    @pytest.mark.smoke
     @pytest.mark.asyncio
-    async def test_admin_access_system_override(self, admin_client):
-        """Test admin can access system override status"""
-        response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/system/override/status")
-        assert response.status_code == 200
-
-    @pytest.mark.asyncio
-    async def test_admin_access_audit_logs(self, admin_client):
-        """Test admin can access audit logs"""
-        response = await admin_client.get(f"{CONTROL_PANEL_URL}/control/system/audit-logs")
-        assert response.status_code == 200
\ No newline at end of file
+    async def test_admin_access_bundle(self, admin_client):
+        """Test admin can reach every protected endpoint, probed concurrently"""
+        responses = await asyncio.gather(
+            *(admin_client.get(path) for path in ADMIN_ENDPOINTS)
+        )
+        assert [r.status_code for r in responses] == [200] * len(ADMIN_ENDPOINTS)
\ No newline at end of file
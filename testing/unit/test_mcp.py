@@ -1,69 +1,108 @@
 """Unit tests for MCP server"""
 import pytest
-from ..conftest import MCP_URL
+import asyncio
+from epic_api import (
+    MCP_HEALTH_PATH, MCP_TOOL_DETAIL_PATH, MCP_TOOLS_LIST_PATH, MCP_VERIFY_BATCH_PATH,
+    MCP_VERIFY_PATH, ToolDetail, VerifyResponse, ok_json
+)
 
 class TestMCPServer:
     """Test MCP server functionality"""
     
+    @pytest.mark.smoke
     @pytest.mark.asyncio
     async def test_mcp_health(self, anonymous_client):
         """Test MCP server health endpoint"""
-        response = await anonymous_client.get(f"{MCP_URL}/health")
-        assert response.status_code == 200
-        data = response.json()
+        data = ok_json(await anonymous_client.get(MCP_HEALTH_PATH))
         assert data["status"] in ["healthy", "degraded"]
         assert "tools" in data
 
+    @pytest.mark.regression
     @pytest.mark.asyncio
-    async def test_list_tools(self, anonymous_client):
+    async def test_list_tools(self, mcp_catalog):
         """Test listing MCP tools"""
-        response = await anonymous_client.get(f"{MCP_URL}/mcp/tools/list")
-        assert response.status_code == 200
-        tools = response.json()
-        assert isinstance(tools, list)
+        assert isinstance(mcp_catalog, list)
         
         # Check for core tools
-        tool_names = [tool["name"] for tool in tools]
+        tool_names = [tool["name"] for tool in mcp_catalog]
         assert "donna_protection" in tool_names
 
+    @pytest.mark.regression
     @pytest.mark.asyncio
     async def test_verify_capability(self, anonymous_client):
         """Test capability verification"""
-        response = await anonymous_client.post(
-            f"{MCP_URL}/mcp/tools/verify",
+        data = ok_json(await anonymous_client.post(
+            MCP_VERIFY_PATH,
             json={
                 "tool_name": "donna_protection",
                 "capability": "check_family_impact",
                 "agent_name": "test_agent"
             }
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["verified"] is True
-        assert data["tool_name"] == "donna_protection"
+        ), model=VerifyResponse)
+        assert data.verified is True
+        assert data.tool_name == "donna_protection"
 
+    @pytest.mark.regression
     @pytest.mark.asyncio
     async def test_verify_nonexistent_tool(self, anonymous_client):
         """Test verification of non-existent tool"""
-        response = await anonymous_client.post(
-            f"{MCP_URL}/mcp/tools/verify",
+        data = ok_json(await anonymous_client.post(
+            MCP_VERIFY_PATH,
             json={
                 "tool_name": "nonexistent_tool",
                 "capability": "fake_capability",
                 "agent_name": "test_agent"
             }
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["verified"] is False
-        assert "not found" in data["message"].lower()
+        ), model=VerifyResponse)
+        assert data.verified is False
+        assert "not found" in data.message.lower()
+
+    @pytest.mark.smoke
+    @pytest.mark.asyncio
+    async def test_verify_batch(self, anonymous_client):
+        """Test verifying several capabilities in one request"""
+        results = ok_json(await anonymous_client.post(
+            MCP_VERIFY_BATCH_PATH,
+            json={
+                "requests": [
+                    {
+                        "tool_name": "donna_protection",
+                        "capability": "check_family_impact",
+                        "agent_name": "test_agent"
+                    },
+                    {
+                        "tool_name": "nonexistent_tool",
+                        "capability": "fake_capability",
+                        "agent_name": "test_agent"
+                    }
+                ]
+            }
+        ), model=list[VerifyResponse])
+        assert [r.tool_name for r in results] == ["donna_protection", "nonexistent_tool"]
+        assert results[0].verified is True
+        assert results[1].verified is False
+        assert "not found" in results[1].message.lower()
 
+    @pytest.mark.regression
     @pytest.mark.asyncio
     async def test_get_tool_details(self, anonymous_client):
         """Test getting tool details"""
-        response = await anonymous_client.get(f"{MCP_URL}/mcp/tools/donna_protection")
-        assert response.status_code == 200
-        data = response.json()
-        assert "tool" in data
-        assert data["tool"]["name"] == "donna_protection"
-        assert data["tool"]["verified"] is True
\ No newline at end of file
+        details = ok_json(
+            await anonymous_client.get(MCP_TOOL_DETAIL_PATH),
+            model=ToolDetail
+        )
+        assert details.tool.name == "donna_protection"
+        assert details.tool.verified is True
+
+    @pytest.mark.smoke
+    @pytest.mark.asyncio
+    async def test_mcp_read_bundle(self, anonymous_client):
+        """Test health, tool listing and tool details, probed concurrently"""
+        health, tools, details = await asyncio.gather(
+            anonymous_client.get(MCP_HEALTH_PATH),
+            anonymous_client.get(MCP_TOOLS_LIST_PATH),
+            anonymous_client.get(MCP_TOOL_DETAIL_PATH)
+        )
+        assert health.status_code == 200
+        assert "donna_protection" in [tool["name"] for tool in ok_json(tools)]
+        assert ok_json(details, model=ToolDetail).tool.name == "donna_protection"
\ No newline at end of file